@@ -7,7 +7,8 @@ from collections import Counter
 from concurrent.futures import ProcessPoolExecutor
 from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, cast, overload
+from functools import cache
+from typing import TYPE_CHECKING, ClassVar, cast, overload
 
 import aiohttp
 import discord
@@ -27,15 +28,15 @@ if TYPE_CHECKING:
     from datetime import datetime
     from typing import Any, Unpack
 
-    from anyio import Path
     from discord import Message, app_commands
     from discord.ext.commands.bot import _BotOptions  # type: ignore[]
     from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
+    from .settings import Settings
     from .utils.context import Interaction
 
     class BotOptions(_BotOptions, total=False):
-        command_prefix: Callable[[commands.Bot, Message], list[str]]
+        command_prefix: Callable[[commands.Bot, Message], Iterable[str]]
         help_attrs: dict[str, Any]
         case_insensitive: bool
         intents: discord.Intents
@@ -51,13 +52,15 @@ CYAN, RESET = Fore.CYAN, Fore.RESET
 # Bot
 COGS_PACKAGE_NAME = COGS_FOLDER_PATH.name
 BOT_PREFIXES = ('water ', 'Water ', 'ww ', 'Ww ')
+# Only the intents that are actually consumed; every extra intent is a stream of
+# gateway events that gets decoded and dispatched for nothing.
+# `emojis_and_stickers` keeps the guild emoji and sticker caches the debug
+# commands look up, `members` stays for member converters, but guilds are not
+# chunked on login.
 INTENTS = discord.Intents(
     emojis_and_stickers=True,
     message_content=True,
-    reactions=True,
-    webhooks=True,
     messages=True,
-    invites=True,
     members=True,
     guilds=True,
 )
@@ -75,23 +78,30 @@ class SoftbanResult:
     ban_applied: bool
 
 
-def _get_prefix(bot: commands.Bot, message: Message) -> list[str]:
-    return commands.when_mentioned_or(*BOT_PREFIXES)(bot, message)
+def _get_prefix(bot: commands.Bot, _message: Message) -> tuple[str, ...]:
+    return cast('MoistBot', bot).command_prefixes
 
 
-def is_extension_file(path: Path) -> bool:
-    return path.suffix == '.py' and path.stem != '__init__'
+def is_extension_file(name: str) -> bool:
+    return name.endswith('.py') and name != '__init__.py'
 
 
-async def discover_extension_names() -> tuple[str, ...]:
-    extension_names = [
-        file.stem
-        async for file in COGS_FOLDER_PATH.iterdir()
-        if is_extension_file(file)
-    ]
+@cache
+def _scan_extension_names() -> tuple[str, ...]:
+    # A single scandir pass reads the names straight from the directory listing
+    with os.scandir(COGS_FOLDER_PATH) as entries:
+        extension_names = [
+            entry.name.removesuffix('.py')
+            for entry in entries
+            if is_extension_file(entry.name)
+        ]
     return tuple(sorted(extension_names))
 
 
+async def discover_extension_names() -> tuple[str, ...]:
+    return await asyncio.to_thread(_scan_extension_names)
+
+
 def normalize_extension_name(name: str) -> str:
     normalized = name
     for prefix in (
@@ -117,6 +127,7 @@ class MoistBot(commands.Bot):
     honeypot: HoneypotManager
     spam_control: commands.CooldownMapping[Message]
 
+    bot_prefixes: ClassVar[tuple[str, ...]] = BOT_PREFIXES
     reminder = None
 
     def __init__(
@@ -129,13 +140,16 @@ class MoistBot(commands.Bot):
         kwargs.setdefault('help_attrs', {'hidden': True})
         kwargs.setdefault('command_prefix', _get_prefix)
         kwargs.setdefault('tree_cls', MoistCommandTree)
-        kwargs.setdefault('enable_debug_events', True)
+        kwargs.setdefault('enable_debug_events', settings.socket_stats)
         kwargs.setdefault('case_insensitive', True)
         kwargs.setdefault('intents', INTENTS)
+        kwargs.setdefault('chunk_guilds_at_startup', False)
+        kwargs.setdefault('max_messages', None)
 
         super().__init__(**kwargs)
 
         self.startup_extensions: Iterable[str] | None = startup_extensions
+        self.command_prefixes: tuple[str, ...] = self.bot_prefixes
 
         # Meta
         self.cooldowns: dict[tuple[int, str], datetime] = {}
@@ -165,15 +179,26 @@ class MoistBot(commands.Bot):
             else self.startup_extensions
         )
 
-        for name in extension_names:
-            try:
-                await self.load_extension(name)
-                log.info(f'Loaded extension {CYAN}{name}{RESET}.')
-            except commands.ExtensionError:
-                log.exception(f'Failed to load extension {CYAN}{name}{RESET}.')
+        await asyncio.gather(*(self._load_cog(name) for name in extension_names))
+
+    async def _load_cog(self, name: str) -> None:
+        try:
+            await self.load_extension(name)
+            log.info(f'Loaded extension {CYAN}{name}{RESET}.')
+        except commands.ExtensionError:
+            log.exception(f'Failed to load extension {CYAN}{name}{RESET}.')
+
+    def _build_command_prefixes(self) -> tuple[str, ...]:
+        """Build the same prefixes as `when_mentioned_or` once instead of per message."""
+
+        if self.user is None:
+            return self.bot_prefixes
+
+        user_id = self.user.id
+        return (f'<@{user_id}> ', f'<@!{user_id}> ', *self.bot_prefixes)
 
     async def setup_hook(self) -> None:
-        self.executor = self._create_process_pool()
+        self.command_prefixes = self._build_command_prefixes()
         self.session = aiohttp.ClientSession()
 
         tasks = [
@@ -248,6 +273,10 @@ class MoistBot(commands.Bot):
         if message.author.bot:
             return
 
+        # Plain chat is by far the most common case, skip building a context for it
+        if not message.content.startswith(self.command_prefixes):
+            return
+
         ctx: Context = await self.get_context(message)
         if ctx.command is None:
             return
@@ -455,6 +484,14 @@ class MoistBot(commands.Bot):
     def _create_process_pool() -> ProcessPoolExecutor:
         return ProcessPoolExecutor(max_workers=min(os.process_cpu_count() or 1, 4))
 
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Return the shared process pool, spawning the workers on first use."""
+
+        if not hasattr(self, 'executor'):
+            self.executor = self._create_process_pool()
+
+        return self.executor
+
     async def _replace_process_pool(self, failed_executor: ProcessPoolExecutor) -> None:
         async with self._executor_lock:
             if self.executor is not failed_executor:
@@ -472,7 +509,7 @@ class MoistBot(commands.Bot):
         """Run CPU-heavy work in the shared process pool."""
 
         loop = asyncio.get_running_loop()
-        executor = self.executor
+        executor = self._get_process_pool()
 
         try:
             return await loop.run_in_executor(executor, func, *args)
@@ -482,5 +519,5 @@ class MoistBot(commands.Bot):
             return await loop.run_in_executor(self.executor, func, *args)
 
     @property
-    def config(self) -> Any:
-        return __import__('settings')
+    def config(self) -> Settings:
+        return settings
@@ -3,7 +3,6 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import discord
-from discord.ext import commands
 
 from moist_bot.bot import MoistBot
 from moist_bot.settings import settings
@@ -11,8 +10,6 @@ from moist_bot.settings import settings
 if TYPE_CHECKING:
     from typing import Final, Unpack
 
-    from discord import Message
-
     from moist_bot.bot import BotOptions
 
 
@@ -30,13 +27,10 @@ FLEABOT_EXTENSIONS: Final = (
 BOT_PREFIXES: Final = ('fb ', 'Fb ')
 
 
-def _get_prefix(bot: commands.Bot, message: Message) -> list[str]:
-    return commands.when_mentioned_or(*BOT_PREFIXES)(bot, message)
-
-
 class FleaBot(MoistBot):
+    bot_prefixes = BOT_PREFIXES
+
     def __init__(self, **kwargs: Unpack[BotOptions]) -> None:
-        kwargs.setdefault('command_prefix', _get_prefix)
         super().__init__(startup_extensions=FLEABOT_EXTENSIONS, **kwargs)
 
     async def start(
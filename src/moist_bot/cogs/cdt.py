@@ -16,8 +16,12 @@ if TYPE_CHECKING:
 
 log = logging.getLogger('discord.' + __name__)
 
+COOLDOWN = datetime.timedelta(seconds=10)
+
 
 class CooldownTest(commands.Cog):
+    __slots__ = ('bot',)
+
     def __init__(self, bot: MoistBot):
         self.bot: MoistBot = bot
 
@@ -29,7 +33,7 @@ class CooldownTest(commands.Cog):
     @commands.cooldown(rate=1, per=10, type=commands.BucketType.user)
     @commands.command(hidden=True)
     async def cdt(self, ctx: Context, user: discord.Member = commands.Author):
-        after = discord.utils.utcnow() + datetime.timedelta(seconds=10)
+        after = discord.utils.utcnow() + COOLDOWN
         dt = discord.utils.format_dt(after, style='R')
 
         await ctx.reply(f'{user.display_name}: {dt}', delete_after=10)
@@ -1,11 +1,13 @@
-# ruff: noqa: PLR0911
 # pyright: reportMissingTypeStubs=false
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import timedelta
-from typing import TYPE_CHECKING
+from functools import cache
+from itertools import islice
+from typing import TYPE_CHECKING, Any
 
 import discord
 from discord.ext import commands
@@ -15,12 +17,30 @@ from moist_bot.utils.formats import human_join
 from .mp3 import FileTooBig
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Coroutine
+    from datetime import datetime
+
     from moist_bot.bot import MoistBot
     from moist_bot.utils.context import Context
 
 
 log = logging.getLogger('discord.' + __name__)
 
+# The command errors that carry the underlying exception as `.original`
+WRAPPED_ERRORS = (
+    commands.CommandInvokeError,
+    commands.HybridCommandError,
+    commands.ConversionError,
+)
+IGNORED_ERRORS: tuple[type[Exception], ...] = (
+    commands.DisabledCommand,
+    commands.CommandNotFound,
+    commands.NotOwner,
+    FileTooBig,
+)
+IGNORED_ERROR_TYPES = frozenset(IGNORED_ERRORS)
+COOLDOWN_MESSAGE = ':warning: You are on cooldown. Try again <t:{}:R>.'
+
 
 def format_range_error(error: commands.RangeError) -> str:
     """Format a range validation error for command replies."""
@@ -45,6 +65,20 @@ def format_range_error(error: commands.RangeError) -> str:
     return f':warning: Value must be {bounds}; received {value}.'
 
 
+def prune_cooldowns(
+    cooldowns: dict[tuple[int, str], datetime], now: datetime, *, limit: int = 8
+) -> None:
+    """Drop expired cooldown notices from the oldest end of the mapping.
+
+    Entries are re-inserted on every write, so the mapping stays roughly ordered
+    by expiry and a small bounded sweep keeps it at the size of active users.
+    """
+
+    for key, expires_at in list(islice(cooldowns.items(), limit)):
+        if expires_at <= now:
+            del cooldowns[key]
+
+
 async def handle_cooldown_error(
     ctx: Context, error: commands.CommandOnCooldown
 ) -> None:
@@ -57,22 +91,142 @@ async def handle_cooldown_error(
     if author_cooldown is not None and utcnow < author_cooldown:
         return
 
+    prune_cooldowns(ctx.bot.cooldowns, utcnow)
+
     # Set a new cooldown
     seconds = error.retry_after
     tm_in = utcnow + timedelta(seconds=seconds)
+    ctx.bot.cooldowns.pop(cooldown_key, None)
     ctx.bot.cooldowns[cooldown_key] = tm_in
 
-    tm_fmt = discord.utils.format_dt(tm_in, 'R')
     await ctx.reply(
-        f':warning: You are on cooldown. Try again {tm_fmt}.',
+        COOLDOWN_MESSAGE.format(int(tm_in.timestamp())),
         delete_after=seconds,
         ephemeral=True,
     )
 
 
+async def handle_no_private_message(
+    ctx: Context, _error: commands.NoPrivateMessage
+) -> None:
+    try:
+        await ctx.author.send(
+            f":no_entry_sign: `{ctx.command}` can't be used in Private Messages."
+        )
+    except discord.HTTPException:
+        pass
+
+
+async def handle_missing_argument_error(
+    ctx: Context, error: commands.MissingRequiredArgument
+) -> None:
+    await ctx.reply(
+        f':warning: Missing required parameter `{error.param.name}`.',
+        ephemeral=True,
+    )
+
+
+async def handle_member_not_found_error(
+    ctx: Context, error: commands.MemberNotFound
+) -> None:
+    await ctx.reply(f':warning: Member `{error.argument}` not found.', ephemeral=True)
+
+
+async def handle_bad_literal_error(
+    ctx: Context, error: commands.BadLiteralArgument
+) -> None:
+    param = error.param
+    to_string = [repr(literal) for literal in error.literals]
+    fmt = human_join(to_string)
+
+    await ctx.reply(
+        f':warning: Parameter `{param.displayed_name or param.name}` can only be {fmt}.',
+        ephemeral=True,
+    )
+
+
+async def handle_range_error(ctx: Context, error: commands.RangeError) -> None:
+    await ctx.reply(format_range_error(error), ephemeral=True)
+
+
+async def handle_bad_argument_error(ctx: Context, error: commands.BadArgument) -> None:
+    if error_str := str(error):
+        await ctx.reply(f':warning: {error_str}', ephemeral=True)
+
+
+async def handle_nsfw_channel_error(
+    ctx: Context, _error: commands.NSFWChannelRequired
+) -> None:
+    await ctx.reply(
+        f':no_entry_sign: `{ctx.command}` can only be used in NSFW channels.'
+    )
+
+
+async def handle_check_failure(ctx: Context, error: commands.CheckFailure) -> None:
+    if error_str := str(error):
+        await ctx.reply(f':warning: {error_str}', ephemeral=True)
+        return
+
+    await ctx.reply(':warning: You are unable to run this command.', ephemeral=True)
+
+
+type ErrorHandlerFunc = Callable[[Context, Any], Awaitable[None]]
+
+# Keyed by exact type, resolved along the MRO so subclasses still reach the
+# handler of their closest handled base (e.g. MemberNotFound before BadArgument)
+ERROR_HANDLERS: dict[type[Exception], ErrorHandlerFunc] = {
+    commands.CommandOnCooldown: handle_cooldown_error,
+    commands.NoPrivateMessage: handle_no_private_message,
+    commands.MissingRequiredArgument: handle_missing_argument_error,
+    commands.MemberNotFound: handle_member_not_found_error,
+    commands.BadLiteralArgument: handle_bad_literal_error,
+    commands.RangeError: handle_range_error,
+    commands.BadArgument: handle_bad_argument_error,
+    commands.NSFWChannelRequired: handle_nsfw_channel_error,
+    commands.CheckFailure: handle_check_failure,
+}
+
+
+@cache
+def resolve_error_handler(error_type: type[Exception]) -> ErrorHandlerFunc | None:
+    """Return the handler for the closest handled base class of an error type."""
+
+    for cls in error_type.__mro__:
+        handler = ERROR_HANDLERS.get(cls)
+        if handler is not None:
+            return handler
+
+    return None
+
+
 class ErrorHandler(commands.Cog):
+    __slots__ = ('_reply_tasks', 'bot')
+
     def __init__(self, bot: MoistBot):
         self.bot: MoistBot = bot
+        self._reply_tasks: set[asyncio.Task[Any]] = set()
+
+    async def cog_unload(self) -> None:
+        for task in self._reply_tasks:
+            task.cancel()
+
+    def _handle_reply_done(self, task: asyncio.Task[Any]) -> None:
+        """Release a finished error reply task and log its failure."""
+
+        self._reply_tasks.discard(task)
+        try:
+            task.result()
+        except asyncio.CancelledError:
+            return
+        except Exception:
+            log.exception('Failed to reply to a command error.')
+
+    def _spawn_reply(self, coro: Coroutine[Any, Any, Any]) -> None:
+        """Send an error reply in the background so the dispatcher is not held up."""
+
+        task = asyncio.create_task(coro)
+        self._reply_tasks.add(task)
+        task.add_done_callback(self._handle_reply_done)
 
     @property
     def display_emoji(self) -> discord.PartialEmoji:
@@ -92,87 +246,33 @@ class ErrorHandler(commands.Cog):
         #     if cog._get_overridden_method(cog.cog_command_error) is not None:
         #         return
 
-        ignored = (
-            commands.DisabledCommand,
-            commands.CommandNotFound,
-            commands.NotOwner,
-            FileTooBig,
-        )
-
         # Allows us to check for original exceptions raised and sent to CommandInvokeError.
         # If nothing is found. We keep the exception passed to on_command_error.
-        error = getattr(error, 'original', error)
+        if isinstance(error, WRAPPED_ERRORS):
+            error = error.original
 
         # Anything in ignored will return and prevent anything happening.
-        if isinstance(error, ignored):
+        if type(error) in IGNORED_ERROR_TYPES or isinstance(error, IGNORED_ERRORS):
             return None
 
-        if isinstance(error, commands.CommandOnCooldown):
-            return await handle_cooldown_error(ctx, error)
-
         # elif isinstance(error, commands.DisabledCommand):
         #     await ctx.reply(f':no_entry_sign: `{ctx.command}` has been disabled.', ephemeral=True)
         #     return
 
-        if isinstance(error, commands.NoPrivateMessage):
-            try:
-                return await ctx.author.send(
-                    f":no_entry_sign: `{ctx.command}` can't be used in Private Messages."
-                )
-            except discord.HTTPException:
-                pass
-
-        elif isinstance(error, commands.MissingRequiredArgument):
-            return await ctx.reply(
-                f':warning: Missing required parameter `{error.param.name}`.',
-                ephemeral=True,
-            )
-
-        elif isinstance(error, commands.MemberNotFound):
-            return await ctx.reply(
-                f':warning: Member `{error.argument}` not found.', ephemeral=True
-            )
-
-        elif isinstance(error, commands.BadLiteralArgument):
-            literals = error.literals
-            param = error.param
-
-            to_string = [repr(literal) for literal in literals]
-            fmt = human_join(to_string)
-
-            return await ctx.reply(
-                f':warning: Parameter `{param.displayed_name or param.name}` can only be {fmt}.',
-                ephemeral=True,
-            )
-
-        elif isinstance(error, commands.RangeError):
-            return await ctx.reply(format_range_error(error), ephemeral=True)
-
-        elif isinstance(error, commands.BadArgument):
-            if error_str := str(error):
-                return await ctx.reply(f':warning: {error_str}', ephemeral=True)
+        handler = resolve_error_handler(type(error))
+        if handler is not None:
+            return self._spawn_reply(handler(ctx, error))
 
-        elif isinstance(error, commands.NSFWChannelRequired):
-            return await ctx.reply(
-                f':no_entry_sign: `{ctx.command}` can only be used in NSFW channels.'
-            )
-
-        elif isinstance(error, commands.CheckFailure):
-            if error_str := str(error):
-                return await ctx.reply(f':warning: {error_str}', ephemeral=True)
-            return await ctx.reply(
-                ':warning: You are unable to run this command.', ephemeral=True
-            )
-
-        else:
-            # All other Errors not returned come here. And we can just print the default TraceBack.
-            log.error(
-                f"Error in guild '{ctx.guild}', triggered by {ctx.author}, with command '{ctx.command}'\n",
-                exc_info=error,
-            )
-            return await ctx.reply(
+        # All other Errors not returned come here. And we can just print the default TraceBack.
+        log.error(
+            f"Error in guild '{ctx.guild}', triggered by {ctx.author}, with command '{ctx.command}'\n",
+            exc_info=error,
+        )
+        return self._spawn_reply(
+            ctx.reply(
                 f':anger: Command raised unhandled error:\n`{error}`', ephemeral=True
             )
+        )
 
 
 async def setup(bot: MoistBot) -> None:
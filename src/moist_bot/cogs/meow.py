@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from random import choice, randint
+import asyncio
+from random import choices, randint
 from typing import TYPE_CHECKING, ClassVar
 
 import discord
@@ -11,36 +12,42 @@ from discord.ext import commands
 
 from moist_bot.settings import settings
 
-pyperclip.determine_clipboard()
-
 if TYPE_CHECKING:
+    from typing import Final
+
     from moist_bot.bot import MoistBot
     from moist_bot.utils.context import Context
 
 
+MEOW_WORDS: Final = (
+    'nya~',
+    'meow',
+    'mrow',
+    'nyah~',
+    'mew',
+    'mrooowww',
+    'meoow',
+    'mrrrp',
+    'mrp',
+    'meoww',
+    'nyaaaaa~',
+    ':3',
+    'uwu',
+    'owo',
+    'owu',
+    'UwU',
+    'OwO',
+    'tehe',
+    'rawr',
+    'purr',
+)
+MAX_MEOW_WORD_LENGTH: Final = max(map(len, MEOW_WORDS))
+
+
 class Meow(commands.Cog):
-    word_list: ClassVar[list[str]] = [
-        'nya~',
-        'meow',
-        'mrow',
-        'nyah~',
-        'mew',
-        'mrooowww',
-        'meoow',
-        'mrrrp',
-        'mrp',
-        'meoww',
-        'nyaaaaa~',
-        ':3',
-        'uwu',
-        'owo',
-        'owu',
-        'UwU',
-        'OwO',
-        'tehe',
-        'rawr',
-        'purr',
-    ]
+    __slots__ = ('bot',)
+
+    word_list: ClassVar[tuple[str, ...]] = MEOW_WORDS
 
     def __init__(self, bot: MoistBot):
         self.bot: MoistBot = bot
@@ -62,15 +69,25 @@ class Meow(commands.Cog):
         if random_size > 500:
             return await ctx.reply(":warning: I can't meow that long >~<")
 
-        random_words = [choice(self.word_list) for _ in range(random_size)]
-        random_sentence = ' '.join(random_words)
+        random_words = choices(MEOW_WORDS, k=random_size)
 
-        if len(random_sentence) > 2000:
+        # Only measure when the longest possible meow could overflow
+        if (
+            random_size * (MAX_MEOW_WORD_LENGTH + 1) > 2001
+            and sum(map(len, random_words)) + random_size - 1 > 2000
+        ):
             return await ctx.reply(":warning: I can't meow that long >~<")
 
+        random_sentence = ' '.join(random_words)
+
         # Automatically copy the contents to the clipboard for bot owners :3
+        # pyperclip shells out to the clipboard tool, so keep it off the event loop.
+        # The clipboard is resolved on first copy, headless hosts simply have none.
         if not settings.use_fleabot and await self.bot.is_owner(ctx.author):
-            pyperclip.copy(random_sentence)
+            try:
+                await asyncio.to_thread(pyperclip.copy, random_sentence)
+            except pyperclip.PyperclipException:
+                pass
 
         await ctx.reply(random_sentence)
 
@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import asyncio
 import inspect
-import itertools
 import unicodedata
-from typing import TYPE_CHECKING, Any
+from functools import cached_property, lru_cache
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, ClassVar
+from weakref import WeakKeyDictionary
 
 import discord
 from discord.ext import commands, menus
@@ -25,6 +27,32 @@ https://github.com/Rapptz/RoboDanny
 """
 
 
+# Help commands are copied per invocation, so signatures are cached per command
+# object here and die with the command when its cog is unloaded
+_command_signatures: WeakKeyDictionary[commands.Command[Any, ..., Any], str] = (
+    WeakKeyDictionary()
+)
+
+
+_PERMISSION_NAMES: dict[str, str] = {
+    name: name.replace('_', ' ').replace('guild', 'server').title()
+    for name in discord.Permissions.VALID_FLAGS
+}
+
+
+@lru_cache
+def _short_description(description: str) -> str | None:
+    # Cog descriptions come from class docstrings, so they are split only once
+    return description.split('\n', 1)[0] or None
+
+
+@lru_cache(maxsize=4096)
+def _char_line(c: str) -> str:
+    digit = f'{ord(c):x}'
+    name = unicodedata.name(c, 'Name not found.')
+    return f'`\\U{digit:>08}`: {name} - {c} \N{EM DASH} <http://www.fileformat.info/info/unicode/char/{digit}>'
+
+
 class GroupHelpPageSource(menus.ListPageSource):
     entries: list[commands.Command[Any, ..., Any]]
 
@@ -40,6 +68,14 @@ class GroupHelpPageSource(menus.ListPageSource):
         self.prefix: str = prefix
         self.title: str = f'{self.group.qualified_name} Commands'
         self.description: str = self.group.description
+        self._signatures: dict[commands.Command[Any, ..., Any], str] = {}
+
+    def get_signature(self, command: commands.Command[Any, ..., Any]) -> str:
+        signature = self._signatures.get(command)
+        if signature is None:
+            signature = f'{command.qualified_name} {command.signature}'
+            self._signatures[command] = signature
+        return signature
 
     async def format_page(  # pyright: ignore[reportIncompatibleMethodOverride]
         self, menu: RoboPages, cmds: list[commands.Command[Any, ..., Any]]
@@ -51,9 +87,8 @@ class GroupHelpPageSource(menus.ListPageSource):
         )
 
         for command in cmds:
-            signature = f'{command.qualified_name} {command.signature}'
             embed.add_field(
-                name=signature,
+                name=self.get_signature(command),
                 value=command.short_doc or '',
                 inline=False,
             )
@@ -71,6 +106,12 @@ class GroupHelpPageSource(menus.ListPageSource):
 
 
 class HelpSelectMenu(discord.ui.Select['HelpMenu']):
+    # Cogs rarely change at runtime, so the options for each set of visible
+    # categories are built once and shared between menus
+    _options_cache: ClassVar[
+        dict[tuple[commands.Cog, ...], list[discord.SelectOption]]
+    ] = {}
+
     def __init__(
         self,
         entries: dict[commands.Cog, list[commands.Command[Any, ..., Any]]],
@@ -89,23 +130,41 @@ class HelpSelectMenu(discord.ui.Select['HelpMenu']):
         self.__fill_options()
 
     def __fill_options(self) -> None:
-        self.add_option(
-            label='Index',
-            emoji='\N{WAVING HAND SIGN}',
-            value='__index',
-            description='The help page showing how to use the bot.',
-        )
-        for cog, cmds in self.commands.items():
-            if not cmds:
-                continue
-            description = cog.description.split('\n', 1)[0] or None
-            emoji = getattr(cog, 'display_emoji', None)
-            self.add_option(
-                label=cog.qualified_name,
-                value=cog.qualified_name,
-                description=description,
-                emoji=emoji,
-            )
+        # Keyed on cog objects, a reloaded cog is a new object with a new entry
+        cache_key = tuple(cog for cog, cmds in self.commands.items() if cmds)
+        options = self._options_cache.get(cache_key)
+        if options is None:
+            loaded_cogs = set(self.bot.cogs.values())
+            stale_keys = [
+                key for key in self._options_cache if not loaded_cogs.issuperset(key)
+            ]
+            for key in stale_keys:
+                del self._options_cache[key]
+
+            options = [
+                discord.SelectOption(
+                    label='Index',
+                    emoji='\N{WAVING HAND SIGN}',
+                    value='__index',
+                    description='The help page showing how to use the bot.',
+                )
+            ]
+            for cog, cmds in self.commands.items():
+                if not cmds:
+                    continue
+                description = _short_description(cog.description)
+                emoji = getattr(cog, 'display_emoji', None)
+                options.append(
+                    discord.SelectOption(
+                        label=cog.qualified_name,
+                        value=cog.qualified_name,
+                        description=description,
+                        emoji=emoji,
+                    )
+                )
+            self._options_cache[cache_key] = options
+
+        self.options = list(options)
 
     async def callback(self, interaction: discord.Interaction) -> None:
         if self.view is None:
@@ -216,6 +275,15 @@ class HelpMenu(RoboPages):
 class PaginatedHelpCommand(commands.HelpCommand):
     context: Context  # pyright: ignore[reportIncompatibleVariableOverride]
 
+    # Shared by the per-invocation copies, keyed by the loaded cogs so that
+    # loading, unloading or reloading an extension rebuilds it
+    _cog_commands_cache: ClassVar[
+        dict[
+            tuple[commands.Cog, ...],
+            dict[commands.Cog, list[commands.Command[Any, ..., Any]]],
+        ]
+    ] = {}
+
     def __init__(self):
         super().__init__(
             command_attrs={
@@ -243,6 +311,10 @@ class PaginatedHelpCommand(commands.HelpCommand):
         await self.context.reply(error)
 
     def get_command_signature(self, command: commands.Command[Any, ..., Any], /) -> str:
+        cached = _command_signatures.get(command)
+        if cached is not None:
+            return cached
+
         parent = command.full_parent_name
         if len(command.aliases) > 0:
             aliases = '|'.join(command.aliases)
@@ -252,27 +324,48 @@ class PaginatedHelpCommand(commands.HelpCommand):
             alias = fmt
         else:
             alias = command.name if not parent else f'{parent} {command.name}'
-        return f'{alias} {command.signature}'
 
-    async def send_bot_help(self, _mapping: Any, /) -> None:
-        bot = self.context.bot
+        signature = f'{alias} {command.signature}'
+        _command_signatures[command] = signature
+        return signature
+
+    def get_cog_commands(
+        self,
+    ) -> dict[commands.Cog, list[commands.Command[Any, ..., Any]]]:
+        """Return every cog's commands, grouped and sorted, before any filtering."""
 
-        def key(command: commands.Command[Any, ..., Any]) -> str:
+        bot = self.context.bot
+        cache_key = tuple(bot.cogs.values())
+        cached = self._cog_commands_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Bucket straight into the owning cog, then sort each bucket and the cogs
+        buckets: dict[commands.Cog, list[commands.Command[Any, ..., Any]]] = {}
+        for command in bot.commands:
             cog = command.cog
-            return cog.qualified_name if cog else '\U0010ffff'
+            if cog is not None:
+                buckets.setdefault(cog, []).append(command)
+
+        for cmds in buckets.values():
+            cmds.sort(key=attrgetter('qualified_name'))
 
-        entries: list[commands.Command[Any, ..., Any]] = await self.filter_commands(
-            bot.commands, sort=True, key=key
+        cog_commands = dict(
+            sorted(buckets.items(), key=lambda item: item[0].qualified_name)
         )
 
-        all_commands: dict[commands.Cog, list[commands.Command[Any, ..., Any]]] = {}
-        for name, children in itertools.groupby(entries, key=key):
-            if name == '\U0010ffff':
-                continue
+        # Only the current set of cogs is worth keeping around
+        self._cog_commands_cache.clear()
+        self._cog_commands_cache[cache_key] = cog_commands
+        return cog_commands
 
-            cog = bot.get_cog(name)
-            assert cog is not None  # noqa: S101
-            all_commands[cog] = sorted(children, key=lambda c: c.qualified_name)
+    async def send_bot_help(self, _mapping: Any, /) -> None:
+        all_commands: dict[commands.Cog, list[commands.Command[Any, ..., Any]]] = {}
+        for cog, cmds in self.get_cog_commands().items():
+            # Checks still depend on the invoker, so only the grouping is cached
+            entries = await self.filter_commands(cmds)
+            if entries:
+                all_commands[cog] = entries
 
         menu = HelpMenu(FrontPageSource(), ctx=self.context)
         menu.add_categories(all_commands)
@@ -330,7 +423,7 @@ class Meta(commands.Cog):
         bot.help_command = PaginatedHelpCommand()
         bot.help_command.cog = self
 
-    @property
+    @cached_property
     def display_emoji(self) -> discord.PartialEmoji:
         return discord.PartialEmoji(name='\N{WHITE QUESTION MARK ORNAMENT}')
 
@@ -352,15 +445,20 @@ class Meta(commands.Cog):
         Only up to 25 characters at a time.
         """
 
-        def to_string(c: str) -> str:
-            digit = f'{ord(c):x}'
-            name = unicodedata.name(c, 'Name not found.')
-            return f'`\\U{digit:>08}`: {name} - {c} \N{EM DASH} <http://www.fileformat.info/info/unicode/char/{digit}>'
+        if len(characters) > 25:
+            return await ctx.reply('Only up to 25 characters at a time.')
+
+        # Bail out as soon as the joined lines would pass the message limit
+        lines: list[str] = []
+        total = 0
+        for c in characters:
+            line = _char_line(c)
+            total += len(line) + 1
+            if total > 2001:
+                return await ctx.reply('Output too long to display.')
+            lines.append(line)
 
-        msg = '\n'.join(map(to_string, characters))
-        if len(msg) > 2000:
-            return await ctx.reply('Output too long to display.')
-        await ctx.reply(msg)
+        await ctx.reply('\n'.join(lines))
 
     @commands.command(name='quit', hidden=True)
     @commands.is_owner()
@@ -381,11 +479,7 @@ class Meta(commands.Cog):
         allowed: list[str] = []
         denied: list[str] = []
         for name, value in permissions:
-            perm_name = name.replace('_', ' ').replace('guild', 'server').title()
-            if value:
-                allowed.append(perm_name)
-            else:
-                denied.append(perm_name)
+            (allowed if value else denied).append(_PERMISSION_NAMES[name])
 
         e.add_field(name='Allowed', value='\n'.join(allowed))
         e.add_field(name='Denied', value='\n'.join(denied))
@@ -421,11 +515,10 @@ class Meta(commands.Cog):
     async def cud(self, ctx: Context):
         """pls no spam"""
 
-        for i in range(3):
-            await ctx.send(str(3 - i))
+        message = await ctx.send('3')
+        for content in ('2', '1', 'go'):
             await asyncio.sleep(1)
-
-        await ctx.send('go')
+            await message.edit(content=content)
 
 
 async def setup(bot: MoistBot) -> None:
@@ -281,7 +281,7 @@ class OwnerDebug(commands.Cog):
         elif isinstance(error, commands.MissingRequiredFlag):
             await ctx.reply(f':warning: {error!s}')
 
-        elif isinstance(error, discord.HTTPException):
+        elif isinstance(error, (discord.HTTPException, FileNotFoundError)):
             log.error('Unable to add sticker', exc_info=error.__traceback__)  # type: ignore[]
             await ctx.reply(':warning: Unable to resolve sticker')
 
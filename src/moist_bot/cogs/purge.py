@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-import operator
 import re
+from collections import Counter
+from functools import cached_property, lru_cache
 from typing import TYPE_CHECKING, Annotated
 
 import discord
@@ -23,6 +25,69 @@ if TYPE_CHECKING:
 
 log = logging.getLogger('discord.' + __name__)
 
+REACTION_CLEAR_CONCURRENCY = 5
+
+URL_RE = re.compile(r'https?://\S+')
+CUSTOM_EMOJI_RE = re.compile(r'<a?:\w+:\d+>')
+UNICODE_EMOJI_RANGES = (
+    (0x1F600, 0x1F64F),
+    (0x1F300, 0x1F5FF),
+    (0x1F680, 0x1F6FF),
+    (0x1F1E0, 0x1F1FF),
+    (0x2702, 0x27B0),
+    (0xFE00, 0xFE0F),
+    (0x1F900, 0x1F9FF),
+    (0x1FA00, 0x1FA6F),
+    (0x1FA70, 0x1FAFF),
+    (0x2600, 0x26FF),
+    (0x200D, 0x200D),
+)
+# Translation table dropping every emoji codepoint in a single C-level pass
+UNICODE_EMOJI_STRIP_TABLE: dict[int, None] = dict.fromkeys(
+    cp for low, high in UNICODE_EMOJI_RANGES for cp in range(low, high + 1)
+)
+
+
+@lru_cache(maxsize=64)
+def compile_user_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile a user supplied pattern, reusing recently seen ones."""
+    return re.compile(pattern)
+
+
+# Message checks
+
+
+def _is_human(m: discord.Message) -> bool:
+    return not m.author.bot
+
+
+def _has_embeds(m: discord.Message) -> bool:
+    return bool(m.embeds)
+
+
+def _has_attachments(m: discord.Message) -> bool:
+    return bool(m.attachments)
+
+
+def _has_image(m: discord.Message) -> bool:
+    for attachment in m.attachments:
+        content_type = attachment.content_type
+        if content_type is not None and content_type.startswith('image/'):
+            return True
+    return any(e.type == 'image' for e in m.embeds)
+
+
+def _has_link(m: discord.Message) -> bool:
+    return URL_RE.search(m.content) is not None
+
+
+def _has_mentions(m: discord.Message) -> bool:
+    return bool(m.mentions)
+
+
+def _is_unpinned(m: discord.Message) -> bool:
+    return not m.pinned
+
 
 # Flag converters
 
@@ -32,13 +97,14 @@ class Snowflake:
 
     @classmethod
     async def convert(cls, ctx: Context, argument: str) -> int:
-        try:
-            return int(argument)
-        except ValueError:
+        # discord.py awaits protocol converters, so this has to stay a coroutine
+        if not (argument.isascii() and argument.isdigit()):
             param = ctx.current_parameter
             name = param.name if param else 'argument'
             msg = f'{name} expected a Discord ID, not {argument!r}'
-            raise commands.BadArgument(msg) from None
+            raise commands.BadArgument(msg)
+
+        return int(argument)
 
 
 class PurgeFlags(
@@ -53,10 +119,12 @@ class PurgeFlags(
         default=None,
     )
 
-    def get_before(self) -> discord.Object | None:
+    @cached_property
+    def before_object(self) -> discord.Object | None:
         return discord.Object(id=self.before) if self.before else None
 
-    def get_after(self) -> discord.Object | None:
+    @cached_property
+    def after_object(self) -> discord.Object | None:
         return discord.Object(id=self.after) if self.after else None
 
 
@@ -95,11 +163,10 @@ class Purge(commands.Cog):
         if ctx.guild is None:  # type: ignore[unreachable]
             raise commands.NoPrivateMessage
 
-        perms = ctx.channel.permissions_for(ctx.author)
-        if not perms.manage_messages:
+        if not ctx.author_perms.manage_messages:
             raise commands.MissingPermissions(['manage_messages'])
 
-        bot_perms = ctx.channel.permissions_for(ctx.guild.me)
+        bot_perms = ctx.bot_perms
         if not bot_perms.manage_messages:
             raise commands.BotMissingPermissions(['manage_messages'])
         if not bot_perms.read_message_history:
@@ -128,8 +195,8 @@ class Purge(commands.Cog):
     ) -> ChannelPurger:
         """Create a ChannelPurger from context and optional flags."""
         if flags is not None:
-            before = before or flags.get_before()
-            after = after or flags.get_after()
+            before = before or flags.before_object
+            after = after or flags.after_object
 
         return ChannelPurger(
             ctx.channel,
@@ -149,17 +216,10 @@ class Purge(commands.Cog):
             )
             return
 
-        authors: dict[str, int] = {}
-        for msg in deleted:
-            name = msg.author.display_name
-            authors[name] = authors.get(name, 0) + 1
-
-        sorted_authors = sorted(
-            authors.items(), key=operator.itemgetter(1), reverse=True
-        )
-        breakdown = '\n'.join(f'**{name}**: {n}' for name, n in sorted_authors[:10])
-        if len(sorted_authors) > 10:
-            breakdown += f'\n*...and {len(sorted_authors) - 10} more*'
+        authors = Counter(msg.author.display_name for msg in deleted)
+        breakdown = '\n'.join(f'**{name}**: {n}' for name, n in authors.most_common(10))
+        if len(authors) > 10:
+            breakdown += f'\n*...and {len(authors) - 10} more*'
 
         embed = discord.Embed(
             description=f'Successfully removed **{plural(count):message}**.',
@@ -174,7 +234,7 @@ class Purge(commands.Cog):
         self,
         ctx: GuildContext,
         limit: int,
-        check: Callable[[discord.Message], bool] = lambda _: True,
+        check: Callable[[discord.Message], bool] | None = None,
         *,
         flags: PurgeFlags | None = None,
         before: discord.abc.Snowflake | None = None,
@@ -266,9 +326,7 @@ class Purge(commands.Cog):
     @commands.cooldown(rate=1, per=10, type=commands.BucketType.guild)
     async def humans(self, ctx: GuildContext, limit: int = 100, *, flags: PurgeFlags):
         """Remove messages sent by humans."""
-        await self._validate_and_purge(
-            ctx, limit, check=lambda m: not m.author.bot, flags=flags
-        )
+        await self._validate_and_purge(ctx, limit, check=_is_human, flags=flags)
 
     @purge.command()
     @app_commands.describe(limit='Number of messages to search through (1-2000)')
@@ -292,51 +350,43 @@ class Purge(commands.Cog):
     @commands.cooldown(rate=1, per=10, type=commands.BucketType.guild)
     async def embeds(self, ctx: GuildContext, limit: int = 100, *, flags: PurgeFlags):
         """Remove messages containing embeds."""
-        await self._validate_and_purge(
-            ctx, limit, check=lambda m: len(m.embeds) > 0, flags=flags
-        )
+        await self._validate_and_purge(ctx, limit, check=_has_embeds, flags=flags)
 
     @purge.command()
     @app_commands.describe(limit='Number of messages to search through (1-2000)')
     @commands.cooldown(rate=1, per=10, type=commands.BucketType.guild)
     async def files(self, ctx: GuildContext, limit: int = 100, *, flags: PurgeFlags):
         """Remove messages with attachments."""
-        await self._validate_and_purge(
-            ctx, limit, check=lambda m: len(m.attachments) > 0, flags=flags
-        )
+        await self._validate_and_purge(ctx, limit, check=_has_attachments, flags=flags)
 
     @purge.command()
     @app_commands.describe(limit='Number of messages to search through (1-2000)')
     @commands.cooldown(rate=1, per=10, type=commands.BucketType.guild)
     async def images(self, ctx: GuildContext, limit: int = 100, *, flags: PurgeFlags):
         """Remove messages with image attachments or image embeds."""
-
-        def check(msg: discord.Message) -> bool:
-            return any(
-                a.content_type is not None and a.content_type.startswith('image/')
-                for a in msg.attachments
-            ) or any(e.type == 'image' for e in msg.embeds)
-
-        await self._validate_and_purge(ctx, limit, check=check, flags=flags)
+        await self._validate_and_purge(ctx, limit, check=_has_image, flags=flags)
 
     @purge.command()
     @commands.cooldown(rate=1, per=10, type=commands.BucketType.guild)
     async def contains(self, ctx: GuildContext, *, flags: TextPurgeFlags):
         """Remove messages containing a substring (case-insensitive)."""
-        lowered = flags.text.lower()
+        needle = flags.text.casefold()
         await self._validate_and_purge(
-            ctx, flags.limit, check=lambda m: lowered in m.content.lower(), flags=flags
+            ctx,
+            flags.limit,
+            check=lambda m: needle in m.content.casefold(),
+            flags=flags,
         )
 
     @purge.command()
     @commands.cooldown(rate=1, per=10, type=commands.BucketType.guild)
     async def startswith(self, ctx: GuildContext, *, flags: TextPurgeFlags):
         """Remove messages starting with a string (case-insensitive)."""
-        lowered = flags.text.lower()
+        needle = flags.text.casefold()
         await self._validate_and_purge(
             ctx,
             flags.limit,
-            check=lambda m: m.content.lower().startswith(lowered),
+            check=lambda m: m.content.casefold().startswith(needle),
             flags=flags,
         )
 
@@ -344,11 +394,11 @@ class Purge(commands.Cog):
     @commands.cooldown(rate=1, per=10, type=commands.BucketType.guild)
     async def endswith(self, ctx: GuildContext, *, flags: TextPurgeFlags):
         """Remove messages ending with a string (case-insensitive)."""
-        lowered = flags.text.lower()
+        needle = flags.text.casefold()
         await self._validate_and_purge(
             ctx,
             flags.limit,
-            check=lambda m: m.content.lower().endswith(lowered),
+            check=lambda m: m.content.casefold().endswith(needle),
             flags=flags,
         )
 
@@ -357,42 +407,28 @@ class Purge(commands.Cog):
     @commands.cooldown(rate=1, per=10, type=commands.BucketType.guild)
     async def links(self, ctx: GuildContext, limit: int = 100, *, flags: PurgeFlags):
         """Remove messages containing URLs."""
-        url_re = re.compile(r'https?://\S+')
-        await self._validate_and_purge(
-            ctx, limit, check=lambda m: bool(url_re.search(m.content)), flags=flags
-        )
+        await self._validate_and_purge(ctx, limit, check=_has_link, flags=flags)
 
     @purge.command()
     @app_commands.describe(limit='Number of messages to search through (1-2000)')
     @commands.cooldown(rate=1, per=10, type=commands.BucketType.guild)
     async def mentions(self, ctx: GuildContext, limit: int = 100, *, flags: PurgeFlags):
         """Remove messages that mention users."""
-        await self._validate_and_purge(
-            ctx, limit, check=lambda m: len(m.mentions) > 0, flags=flags
-        )
+        await self._validate_and_purge(ctx, limit, check=_has_mentions, flags=flags)
 
     @purge.command()
     @app_commands.describe(limit='Number of messages to search through (1-2000)')
     @commands.cooldown(rate=1, per=10, type=commands.BucketType.guild)
     async def emoji(self, ctx: GuildContext, limit: int = 100, *, flags: PurgeFlags):
         """Remove messages that consist entirely of emoji."""
-        custom_re = re.compile(r'<a?:\w+:\d+>')
-        unicode_re = re.compile(
-            r'[\U0001f600-\U0001f64f\U0001f300-\U0001f5ff'
-            r'\U0001f680-\U0001f6ff\U0001f1e0-\U0001f1ff'
-            r'\U00002702-\U000027b0\U0000fe00-\U0000fe0f'
-            r'\U0001f900-\U0001f9ff\U0001fa00-\U0001fa6f'
-            r'\U0001fa70-\U0001faff\U00002600-\U000026ff'
-            r'\U0000200d\U0000fe0f\s]+'
-        )
 
         def check(msg: discord.Message) -> bool:
             content = msg.content.strip()
             if not content:
                 return False
-            content = custom_re.sub('', content)
-            content = unicode_re.sub('', content)
-            return not content.strip()
+            content = CUSTOM_EMOJI_RE.sub('', content)
+            content = content.translate(UNICODE_EMOJI_STRIP_TABLE)
+            return not content or content.isspace()
 
         await self._validate_and_purge(ctx, limit, check=check, flags=flags)
 
@@ -409,20 +445,31 @@ class Purge(commands.Cog):
 
         await self._prepare(ctx)
 
-        before = flags.get_before() or ctx.message
-        after = flags.get_after()
+        before = flags.before_object or ctx.message
+        after = flags.after_object
 
-        count = 0
-        async with ctx.typing():
-            async for message in ctx.channel.history(
-                limit=limit, before=before, after=after
-            ):
-                if message.reactions:
-                    try:
-                        await message.clear_reactions()
-                        count += 1
-                    except discord.HTTPException:
-                        pass
+        semaphore = asyncio.Semaphore(REACTION_CLEAR_CONCURRENCY)
+
+        async def clear(message: discord.Message) -> bool:
+            async with semaphore:
+                try:
+                    await message.clear_reactions()
+                except discord.HTTPException:
+                    return False
+                return True
+
+        # Clear while still scanning, the task group cancels every pending
+        # clear if the command itself is cancelled
+        async with ctx.typing(), asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(clear(message))
+                async for message in ctx.channel.history(
+                    limit=limit, before=before, after=after
+                )
+                if message.reactions
+            ]
+
+        count = sum(task.result() for task in tasks)
 
         await ctx.send(
             f':white_check_mark: Cleared reactions from **{plural(count):message}**.',
@@ -434,9 +481,7 @@ class Purge(commands.Cog):
     @commands.cooldown(rate=1, per=10, type=commands.BucketType.guild)
     async def pins(self, ctx: GuildContext, limit: int = 100, *, flags: PurgeFlags):
         """Remove non-pinned messages (clean a channel while preserving pins)."""
-        await self._validate_and_purge(
-            ctx, limit, check=lambda m: not m.pinned, flags=flags
-        )
+        await self._validate_and_purge(ctx, limit, check=_is_unpinned, flags=flags)
 
     @purge.command(name='after', with_app_command=False)
     @commands.cooldown(rate=1, per=30, type=commands.BucketType.guild)
@@ -495,7 +540,7 @@ class Purge(commands.Cog):
     async def regex(self, ctx: GuildContext, *, flags: RegexPurgeFlags):
         """Remove messages matching a regex pattern."""
         try:
-            compiled = re.compile(flags.pattern)
+            compiled = compile_user_pattern(flags.pattern)
         except re.error as e:
             await ctx.reply(f':warning: Invalid regex: `{e}`')
             return
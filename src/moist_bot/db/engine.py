@@ -4,12 +4,14 @@ from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import event
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import QueuePool
 
 from moist_bot.settings import settings
 
@@ -24,6 +26,8 @@ def _configure_sqlite_connection(
     cursor = dbapi_connection.cursor()
     cursor.execute('PRAGMA journal_mode=WAL')
     cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    cursor.execute('PRAGMA mmap_size=268435456')
     cursor.close()
 
 
@@ -34,8 +38,25 @@ def configure_sqlite_engine(engine: AsyncEngine) -> None:
     event.listen(engine.sync_engine, 'connect', _configure_sqlite_connection)
 
 
+def _pool_options(database_url: str) -> dict[str, Any]:
+    """Return the pool sizing options, if the URL's pool accepts them.
+
+    In-memory SQLite uses a ``StaticPool``, which rejects sizing arguments.
+    """
+
+    url = make_url(database_url)
+    if not issubclass(url.get_dialect().get_pool_class(url), QueuePool):
+        return {}
+    return {
+        'pool_size': settings.database_pool_size,
+        'pool_timeout': settings.database_pool_timeout,
+    }
+
+
 def create_engine() -> AsyncEngine:
-    engine = create_async_engine(settings.database_url)
+    engine = create_async_engine(
+        settings.database_url, **_pool_options(settings.database_url)
+    )
     configure_sqlite_engine(engine)
     return engine
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 __all__ = ('settings',)
 
+import os
 from functools import cached_property
 
 from discord import Object
@@ -21,6 +22,8 @@ class Settings(BaseSettings):
     token: str = ''
     fleabot_token: str = ''
     use_fleabot: bool = False
+    # Raw gateway event dispatch, only consumed by the socket stats tracking
+    socket_stats: bool = True
 
     # Discord
     test_guild_id: int = 294545830742982656
@@ -28,6 +31,9 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = f'sqlite+aiosqlite:///{DB_PATH}'
+    # SQLite serializes writers, so the pool only needs to cover concurrent readers
+    database_pool_size: int = min(10, (os.process_cpu_count() or 1) * 2)
+    database_pool_timeout: float = 5.0
 
     @cached_property
     def test_guild(self) -> Object:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING, Any
 
 import discord
@@ -9,6 +10,8 @@ from discord import app_commands
 from discord.ext import commands
 
 if TYPE_CHECKING:
+    from io import BytesIO
+
     from moist_bot.bot import MoistBot
 
     type Interaction = discord.Interaction[MoistBot]
@@ -19,6 +22,9 @@ else:
         """Project interaction with the client narrowed to the bot."""
 
 
+WEB_STREAM_CHUNK_SIZE = 64 * 1024
+
+
 class MoistCommandTree(app_commands.CommandTree[MoistBot]):
     """Application command tree that enforces blocklist checks globally."""
 
@@ -58,6 +64,7 @@ class ConfirmationView(discord.ui.View):
         self.delete_after: bool = delete_after
         self.author_id: int = author_id
         self.message: discord.Message | None = None
+        self.delete_task: asyncio.Task[None] | None = None
 
     async def interaction_check(self, interaction: discord.Interaction, /) -> bool:
         if interaction.user and interaction.user.id == self.author_id:
@@ -71,15 +78,27 @@ class ConfirmationView(discord.ui.View):
         if self.delete_after and self.message:
             await self.message.delete()
 
+    @staticmethod
+    async def _delete_response(interaction: discord.Interaction) -> None:
+        try:
+            await interaction.delete_original_response()
+        except discord.HTTPException:
+            pass
+
+    async def _acknowledge(self, interaction: discord.Interaction) -> None:
+        """Acknowledge a button press and start deleting the prompt."""
+
+        await interaction.response.defer()
+        if self.delete_after:
+            # The button callback returns right away, Context.prompt awaits this
+            self.delete_task = asyncio.create_task(self._delete_response(interaction))
+
     @discord.ui.button(label='Confirm', style=discord.ButtonStyle.green)
     async def confirm(
         self, interaction: discord.Interaction, _button: discord.ui.Button[Any]
     ):
         self.value = True
-        await interaction.response.defer()
-        if self.delete_after:
-            await interaction.delete_original_response()
-
+        await self._acknowledge(interaction)
         self.stop()
 
     @discord.ui.button(label='Cancel', style=discord.ButtonStyle.red)
@@ -87,10 +106,7 @@ class ConfirmationView(discord.ui.View):
         self, interaction: discord.Interaction, _button: discord.ui.Button[Any]
     ):
         self.value = False
-        await interaction.response.defer()
-        if self.delete_after:
-            await interaction.delete_original_response()
-
+        await self._acknowledge(interaction)
         self.stop()
 
 
@@ -119,6 +135,16 @@ class Context(commands.Context[MoistBot]):
             return ref.resolved
         return None
 
+    @discord.utils.cached_property
+    def author_perms(self) -> discord.Permissions:
+        """The author's permissions in the channel, resolved once per invocation."""
+        return self.channel.permissions_for(self.author)  # type: ignore[arg-type]
+
+    @discord.utils.cached_property
+    def bot_perms(self) -> discord.Permissions:
+        """The bot's permissions in the channel, resolved once per invocation."""
+        return self.channel.permissions_for(self.me)  # type: ignore[arg-type]
+
     @staticmethod
     def tick(opt: bool | None, label: str | None = None) -> str:
         lookup = {
@@ -171,6 +197,10 @@ class Context(commands.Context[MoistBot]):
         )
         view.message = await self.send(message, view=view, ephemeral=delete_after)
         await view.wait()
+        # The prompt must be gone before callers act on the answer, purges
+        # would otherwise pick it up from the channel history
+        if view.delete_task is not None:
+            await view.delete_task
         return view.value
 
     async def web_get(self, url: str):
@@ -179,6 +209,15 @@ class Context(commands.Context[MoistBot]):
                 raise FileNotFoundError(resp.status, resp.url)
             return await resp.read()
 
+    async def web_stream(self, url: str, buffer: BytesIO) -> None:
+        """Write the response body into ``buffer`` without holding a full copy."""
+
+        async with self.bot.session.get(url) as resp:
+            if resp.status != 200:
+                raise FileNotFoundError(resp.status, resp.url)
+            async for chunk in resp.content.iter_chunked(WEB_STREAM_CHUNK_SIZE):
+                buffer.write(chunk)
+
 
 class GuildContext(Context):
     author: discord.Member
@@ -1,10 +1,9 @@
 from __future__ import annotations
 
+import re
 from datetime import UTC, datetime
 from io import BytesIO
 from typing import TYPE_CHECKING, overload
-from urllib import error as url_error
-from urllib.parse import urlparse
 
 if TYPE_CHECKING:
     from moist_bot.utils.context import Context
@@ -12,6 +11,8 @@ if TYPE_CHECKING:
 
 type N = int | float
 
+URL_RE = re.compile(r'https?://[^\s/$.?#][^\s]*', re.IGNORECASE)
+
 
 @overload
 def remove_decimal(number: int, ndigits: int = 2) -> int: ...
@@ -50,11 +51,8 @@ def shorten(value: str, max_length: int) -> str:
 
 
 def is_url(text: str) -> bool:
-    try:
-        result = urlparse(text)
-        return all((result.scheme, result.netloc))
-    except url_error.URLError:
-        return False
+    """Return whether the whole text is a single http(s) URL."""
+    return URL_RE.fullmatch(text) is not None
 
 
 async def get_media_from_ctx(
@@ -63,21 +61,19 @@ async def get_media_from_ctx(
 
     buffer = buffer or BytesIO()
     reply = ctx.replied_message
-    bot = ctx.bot
-    media = b''
+    start = buffer.tell()
 
-    # Fetch media bytes
+    # Write media bytes straight into the buffer
     if arg and is_url(arg):
-        media = await bot.http.get_from_cdn(arg)
+        await ctx.web_stream(arg, buffer)
     elif reply:
         if reply.attachments:
-            media = await reply.attachments[0].read(use_cached=True)
+            await reply.attachments[0].save(buffer, seek_begin=False, use_cached=True)
         elif is_url(reply.content):
-            media = await bot.http.get_from_cdn(reply.content)
+            await ctx.web_stream(reply.content, buffer)
 
-    if not media:
+    if buffer.tell() == start:
         return None
 
-    buffer.write(media)
     buffer.seek(0)
     return buffer
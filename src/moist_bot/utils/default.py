@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING, Any
 
 import discord
@@ -11,10 +12,8 @@ if TYPE_CHECKING:
 
 def can_handle(ctx: Context, permission: str) -> bool:
     """Checks if bot has permissions or is in DMs right now."""
-    return isinstance(ctx.channel, discord.DMChannel) or (
-        ctx.guild is not None
-        and getattr(ctx.channel.permissions_for(ctx.guild.me), permission)
-    )
+    # Bots can't join group DMs, so no guild means a DM
+    return ctx.guild is None or getattr(ctx.bot_perms, permission)
 
 
 class HelpFormat(commands.DefaultHelpCommand):
@@ -38,14 +37,17 @@ class HelpFormat(commands.DefaultHelpCommand):
         self.paginator.close_page()
         await self.send_pages(no_pm=True)
 
-    async def send_pages(self, no_pm: bool = False) -> None:
-        """Sends the help pages to the destination."""
+    async def _add_sent_reaction(self) -> None:
         try:
             if can_handle(self.context, 'add_reactions'):
                 await self.context.message.add_reaction(chr(0x2709))
         except discord.Forbidden:
             pass
 
+    async def send_pages(self, no_pm: bool = False) -> None:
+        """Sends the help pages to the destination."""
+        # React while the pages go out, the pages themselves stay in order
+        reacting = asyncio.create_task(self._add_sent_reaction())
         try:
             destination = self.get_destination(no_pm=no_pm)
             for page in self.paginator.pages:
@@ -53,3 +55,5 @@ class HelpFormat(commands.DefaultHelpCommand):
         except discord.Forbidden:
             destination = self.get_destination(no_pm=True)
             await destination.send("Couldn't send help to you due to blocked DMs...")
+        finally:
+            await reacting
@@ -1,13 +1,12 @@
 from __future__ import annotations
 
-from collections import defaultdict
-from itertools import chain
-from random import randrange
-from typing import TYPE_CHECKING, ClassVar, cast
+from typing import TYPE_CHECKING, ClassVar
 
+import numpy as np
 from PIL import Image as _Image
 
 if TYPE_CHECKING:
+    from numpy.typing import NDArray
     from PIL.Image import Image
 
 
@@ -16,10 +15,13 @@ EMPTY_IMAGE = _Image.new(mode='RGBA', size=(0, 0))
 
 class TransparentAnimatedGifConverter:
     _img_p: Image
-    _img_p_data: bytearray
+    _img_p_data: NDArray[np.uint8]
     _palette_replaces: dict[str, list[int]]
-    _img_p_parsed_palette: dict[int, tuple[int, ...]]
+    # Colors are packed as 0xRRGGBB ints, cheaper to hash than tuples
+    _img_p_parsed_palette: dict[int, int]
     _img_p_used_palette_idxs: set[int]
+    _img_p_palette: NDArray[np.int32]
+    _img_p_used_colors: set[int]
 
     _PALETTE_SLOT_SET: ClassVar[set[int]] = set(range(256))
 
@@ -27,7 +29,7 @@ class TransparentAnimatedGifConverter:
         self._alpha_threshold = alpha_threshold
         self._img_rgba: Image = img_rgba
 
-        self._transparent_pixels: set[int] = set()
+        self._transparent_mask: NDArray[np.bool_] = np.zeros(0, dtype=np.bool_)
 
     @property
     def img_rgba(self) -> Image:
@@ -38,48 +40,40 @@ class TransparentAnimatedGifConverter:
         self._img_rgba = value
 
     def _process_pixels(self) -> None:
-        """Set the transparent pixels to the color 0."""
-        alpha_data = cast('list[int]', self._img_rgba.getchannel(channel='A').getdata())  # pyright: ignore[reportUnknownMemberType]
-        self._transparent_pixels = {
-            idx
-            for idx, alpha in enumerate(alpha_data)
-            if alpha <= self._alpha_threshold
-        }
+        """Mark the pixels at or below the alpha threshold as transparent."""
+        alpha_data = np.frombuffer(
+            self._img_rgba.getchannel(channel='A').tobytes(), dtype=np.uint8
+        )
+        self._transparent_mask = alpha_data <= self._alpha_threshold
 
     def _set_parsed_palette(self) -> None:
-        """Parse the RGB palette color `tuple`s from the palette."""
+        """Parse the packed RGB palette colors from the palette."""
         palette = self._img_p.getpalette()
         if palette is None:
             msg = 'Image has no palette'
             raise ValueError(msg)
 
-        self._img_p_used_palette_idxs = {
-            idx
-            for pal_idx, idx in enumerate(self._img_p_data)
-            if pal_idx not in self._transparent_pixels
-        }
+        # Signed so that color distances can be taken without wrapping around
+        palette_rgb = np.zeros(256 * 3, dtype=np.int32)
+        palette_rgb[: len(palette)] = palette[: 256 * 3]
+        self._img_p_palette = palette_rgb.reshape(-1, 3)
+        # Count each index once in a single linear pass instead of sorting
+        idx_counts = np.bincount(
+            self._img_p_data[~self._transparent_mask], minlength=256
+        )
+        self._img_p_used_palette_idxs = set(np.flatnonzero(idx_counts).tolist())
+        rgb = self._img_p_palette
+        packed = ((rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2]).tolist()
         self._img_p_parsed_palette = {
-            idx: tuple(palette[idx * 3 : idx * 3 + 3])
-            for idx in self._img_p_used_palette_idxs
+            idx: packed[idx] for idx in self._img_p_used_palette_idxs
         }
 
     def _get_similar_color_idx(self) -> int:
         """Return a palette index with the closest similar color."""
-        old_color = self._img_p_parsed_palette[0]
-        dict_distance: defaultdict[int, list[int]] = defaultdict(list)
-        for idx in range(1, 256):
-            color_item = self._img_p_parsed_palette[idx]
-            if color_item == old_color:
-                return idx
-            distance = sum(
-                (
-                    abs(old_color[0] - color_item[0]),  # Red
-                    abs(old_color[1] - color_item[1]),  # Green
-                    abs(old_color[2] - color_item[2]),  # Blue
-                )
-            )
-            dict_distance[distance].append(idx)
-        return dict_distance[min(dict_distance)][0]
+        # Sum of the RGB differences, an identical color is the first zero
+        palette = self._img_p_palette
+        distances = np.abs(palette[1:256] - palette[0]).sum(axis=1)
+        return int(distances.argmin()) + 1
 
     def _remap_palette_idx_zero(self) -> None:
         """Since the first color is used in the palette, remap it."""
@@ -91,49 +85,49 @@ class TransparentAnimatedGifConverter:
         self._img_p_parsed_palette[new_idx] = self._img_p_parsed_palette[0]
         del self._img_p_parsed_palette[0]
 
-    def _get_unused_color(self) -> tuple[int, int, int]:
+    def _get_unused_color(self) -> int:
         """Return a color for the palette that does not collide with any other already in the palette."""
-        used_colors = set(self._img_p_parsed_palette.values())
-        while True:
-            new_color = (randrange(256), randrange(256), randrange(256))  # noqa: S311
-            if new_color not in used_colors:
-                return new_color
+        # Only a few hundred colors are ever in use, so this sweep ends quickly
+        used_colors = self._img_p_used_colors
+        new_color = 0
+        while new_color in used_colors:
+            new_color += 1
+        used_colors.add(new_color)
+        return new_color
 
     def _process_palette(self) -> None:
         """Adjust palette to have the zeroth color set as transparent.
         Basically, get another palette index for the zeroth color.
         """
         self._set_parsed_palette()
+        self._img_p_used_colors = set(self._img_p_parsed_palette.values())
         if 0 in self._img_p_used_palette_idxs:
             self._remap_palette_idx_zero()
         self._img_p_parsed_palette[0] = self._get_unused_color()
 
     def _adjust_pixels(self) -> None:
         """Convert the pixels into their new values."""
-        if self._palette_replaces['idx_from']:
-            trans_table = bytearray.maketrans(
-                bytes(self._palette_replaces['idx_from']),
-                bytes(self._palette_replaces['idx_to']),
-            )
-            self._img_p_data = self._img_p_data.translate(trans_table)
-        for idx_pixel in self._transparent_pixels:
-            self._img_p_data[idx_pixel] = 0
-        self._img_p.frombytes(data=bytes(self._img_p_data))
+        replaces = self._palette_replaces
+        lookup = np.arange(256, dtype=np.uint8)
+        lookup[replaces['idx_from']] = replaces['idx_to']
+        # The lookup writes a fresh array that the transparent pixels are
+        # then cleared in, so the pixel data is only copied once
+        img_p_data = lookup[self._img_p_data]
+        img_p_data[self._transparent_mask] = 0
+        self._img_p.frombytes(data=img_p_data.tobytes())
 
     def _adjust_palette(self) -> None:
         """Modify the palette in the new `Image`."""
-        unused_color = self._get_unused_color()
-        final_palette = tuple(
-            chain.from_iterable(
-                self._img_p_parsed_palette.get(x, unused_color) for x in range(256)
-            )
-        )
-        self._img_p.putpalette(data=final_palette)
+        # Fill every slot with the unused color, then write over the used ones
+        final_palette = bytearray(self._get_unused_color().to_bytes(3)) * 256
+        for idx, color in self._img_p_parsed_palette.items():
+            final_palette[idx * 3 : idx * 3 + 3] = color.to_bytes(3)
+        self._img_p.putpalette(data=bytes(final_palette))
 
     def process(self) -> Image:
         """Return the processed mode `P` `Image`."""
         self._img_p = self._img_rgba.convert(mode='P')
-        self._img_p_data = bytearray(self._img_p.tobytes())
+        self._img_p_data = np.frombuffer(self._img_p.tobytes(), dtype=np.uint8)
         self._palette_replaces = {'idx_from': [], 'idx_to': []}
         self._process_pixels()
         self._process_palette()
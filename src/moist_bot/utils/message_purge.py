@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import datetime
 from itertools import batched
 from typing import TYPE_CHECKING
@@ -9,10 +10,12 @@ from typing import TYPE_CHECKING
 import discord
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable
 
 
 BULK_DELETE_LIMIT = datetime.timedelta(days=14)
+# Single deletes in flight at once, enough to keep the channel's rate limit busy
+SINGLE_DELETE_CONCURRENCY = 5
 type MessageBoundary = discord.abc.Snowflake | datetime.datetime
 
 
@@ -30,6 +33,11 @@ class ChannelPurger:
         self.before: MessageBoundary | None = before
         self.after: MessageBoundary | None = after
         self.deleted: list[discord.Message] = []
+        # Set on the first hard failure, shared by every concurrent deletion
+        self.stopped: bool = False
+        # Batches queue up here while the scan keeps going, so a failure is
+        # seen before the next batch sends its own bulk request
+        self._bulk_lock = asyncio.Lock()
 
     async def _delete_single(self, msg: discord.Message) -> bool:
         """Remove one message and return whether deletion should continue."""
@@ -39,71 +47,131 @@ class ChannelPurger:
         except discord.NotFound:
             pass
         except discord.HTTPException:
+            self.stopped = True
             return False
 
         self.deleted.append(msg)
         return True
 
+    async def _delete_each(self, messages: Iterable[discord.Message]) -> bool:
+        """Remove messages one by one concurrently and return whether to continue."""
+
+        semaphore = asyncio.Semaphore(SINGLE_DELETE_CONCURRENCY)
+
+        async def delete(msg: discord.Message) -> bool:
+            async with semaphore:
+                if self.stopped:
+                    return False
+                return await self._delete_single(msg)
+
+        # Deletes already in flight when one fails still finish and get counted,
+        # queued ones skip themselves once ``stopped`` is set. Cancelling the
+        # gather cancels every task.
+        results = await asyncio.gather(*(delete(msg) for msg in messages))
+        return all(results)
+
     async def _bulk_delete(self, messages: list[discord.Message]) -> None:
         """Bulk-delete in chunks of 100, falling back to individual deletion."""
 
         for chunk in batched(messages, 100, strict=False):
-            try:
-                if len(chunk) == 1:
-                    await chunk[0].delete()
-                else:
-                    await self.channel.delete_messages(chunk)  # type: ignore[attr-defined]
-                self.deleted.extend(chunk)
-            except discord.HTTPException:
-                for msg in chunk:
-                    if not await self._delete_single(msg):
+            async with self._bulk_lock:
+                if self.stopped:
+                    return
+                try:
+                    if len(chunk) == 1:
+                        await chunk[0].delete()
+                    else:
+                        await self.channel.delete_messages(chunk)  # type: ignore[attr-defined]
+                    self.deleted.extend(chunk)
+                except discord.HTTPException:
+                    # Usually only part of the chunk is at fault, so the rest
+                    # can still go through concurrently
+                    if not await self._delete_each(chunk):
                         return
 
+    @staticmethod
+    def _bulk_cutoff_id() -> int:
+        """Return the oldest snowflake that can still be bulk-deleted.
+
+        Message IDs are compared against it directly, which avoids building a
+        ``created_at`` datetime for every message.
+        """
+
+        return discord.utils.time_snowflake(discord.utils.utcnow() - BULK_DELETE_LIMIT)
+
     async def delete_messages(
         self,
         messages: list[discord.Message],
     ) -> list[discord.Message]:
         """Deletes known messages using bulk deletion where possible."""
 
-        now = discord.utils.utcnow()
-        bulk_cutoff = now - BULK_DELETE_LIMIT
+        cutoff_id = self._bulk_cutoff_id()
 
         bulk_msgs: list[discord.Message] = []
         old_msgs: list[discord.Message] = []
         for message in messages:
-            if message.created_at > bulk_cutoff:
-                bulk_msgs.append(message)
-            else:
-                old_msgs.append(message)
+            (bulk_msgs if message.id > cutoff_id else old_msgs).append(message)
 
         await self._bulk_delete(bulk_msgs)
-        for msg in old_msgs:
-            if not await self._delete_single(msg):
-                break
+        if old_msgs and not self.stopped:
+            await self._delete_each(old_msgs)
 
         return self.deleted
 
     async def purge(
         self,
         limit: int,
-        check: Callable[[discord.Message], bool] = lambda _: True,
+        check: Callable[[discord.Message], bool] | None = None,
     ) -> list[discord.Message]:
-        """Collect and delete up to ``limit`` messages matching ``check``."""
+        """Collect and delete up to ``limit`` messages matching ``check``.
+
+        Without a ``check`` every scanned message matches, and no per-message
+        call is made at all.
 
-        messages: list[discord.Message] = []
+        Bulk-deletable messages are deleted in batches of 100 while the history
+        scan is still running, older ones are deleted once the scan is done.
+        """
+
+        cutoff_id = self._bulk_cutoff_id()
+        pending: set[asyncio.Task[None]] = set()
+        batch: list[discord.Message] = []
+        old_msgs: list[discord.Message] = []
+        collected = 0
         scan_limit = min(limit * 5, 5000)
 
-        async for message in self.channel.history(
-            limit=scan_limit,
-            before=self.before,
-            after=self.after,
-        ):
-            if check(message):
-                messages.append(message)
-                if len(messages) >= limit:
+        try:
+            async for message in self.channel.history(
+                limit=scan_limit,
+                before=self.before,
+                after=self.after,
+            ):
+                if self.stopped:
                     break
+                if check is not None and not check(message):
+                    continue
+
+                if message.id > cutoff_id:
+                    batch.append(message)
+                    if len(batch) == 100:
+                        pending.add(asyncio.create_task(self._bulk_delete(batch)))
+                        batch = []
+                else:
+                    old_msgs.append(message)
 
-        if not messages:
-            return self.deleted
+                collected += 1
+                if collected >= limit:
+                    break
 
-        return await self.delete_messages(messages)
+            if batch and not self.stopped:
+                pending.add(asyncio.create_task(self._bulk_delete(batch)))
+
+            await asyncio.gather(*pending)
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        if old_msgs and not self.stopped:
+            await self._delete_each(old_msgs)
+
+        return self.deleted
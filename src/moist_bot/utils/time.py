@@ -6,7 +6,8 @@ from __future__ import annotations
 
 import datetime
 import re
-from typing import TYPE_CHECKING, Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, ClassVar
 
 import parsedatetime as pdt
 from dateutil.relativedelta import relativedelta
@@ -49,6 +50,9 @@ class ShortTime:
         re.VERBOSE,
     )
 
+    # Group names of ``compiled`` in order, matching ``match.groups()``
+    units: ClassVar[tuple[str, ...]] = tuple(compiled.groupindex)
+
     discord_fmt = re.compile(r'<t:(?P<ts>[0-9]+)(?:\:?[RFfDdTt])?>')
 
     dt: datetime.datetime
@@ -60,8 +64,8 @@ class ShortTime:
         now: datetime.datetime | None = None,
         tzinfo: datetime.tzinfo = datetime.UTC,
     ):
-        match = self.compiled.fullmatch(argument)
-        if match is None or not match.group(0):
+        delta = parse_short_time(argument)
+        if delta is None:
             match = self.discord_fmt.fullmatch(argument)
             if match is not None:
                 self.dt = datetime.datetime.fromtimestamp(
@@ -72,12 +76,21 @@ class ShortTime:
                 return
             raise commands.BadArgument('invalid time provided')
 
-        data = {k: int(v) for k, v in match.groupdict(default=0).items()}
         now = now or datetime.datetime.now(datetime.UTC)
-        self.dt = now + relativedelta(**data)  # type: ignore[]
+        self.dt = now + delta
         if tzinfo is not datetime.UTC:
             self.dt = self.dt.astimezone(tzinfo)
 
+    @classmethod
+    def delta_from_match(cls, match: re.Match[str]) -> relativedelta:
+        """Build a delta from the units present in a ``compiled`` match."""
+        data = {
+            unit: int(value)
+            for unit, value in zip(cls.units, match.groups(), strict=True)
+            if value
+        }
+        return relativedelta(**data)  # type: ignore[]
+
     @classmethod
     async def convert(cls, ctx: Context, argument: str) -> Self:
         tzinfo = datetime.UTC
@@ -87,15 +100,31 @@ class ShortTime:
         return cls(argument, now=ctx.message.created_at, tzinfo=tzinfo)
 
 
+@lru_cache(maxsize=256)
+def parse_short_time(argument: str) -> relativedelta | None:
+    """Parse a whole argument as a short time, e.g. ``5m`` or ``1h30m``.
+
+    Reminders tend to reuse the same few durations, so parsed deltas are
+    cached. The returned delta is shared and must not be mutated.
+    """
+
+    # A short time always starts with a digit, skip the regex otherwise
+    if not argument[:1].isdigit():
+        return None
+
+    match = ShortTime.compiled.fullmatch(argument)
+    if match is None or not match.group(0):
+        return None
+    return ShortTime.delta_from_match(match)
+
+
 class RelativeDelta(app_commands.Transformer, commands.Converter):
     @classmethod
     def __do_conversion(cls, argument: str) -> relativedelta:
-        match = ShortTime.compiled.fullmatch(argument)
-        if match is None or not match.group(0):
+        delta = parse_short_time(argument)
+        if delta is None:
             raise ValueError('invalid time provided')
-
-        data = {k: int(v) for k, v in match.groupdict(default=0).items()}
-        return relativedelta(**data)  # type: ignore[]
+        return delta
 
     async def convert(self, ctx: Context, argument: str, /) -> relativedelta:
         try:
@@ -250,6 +279,10 @@ class FriendlyTimeResult:
             self.arg = remaining
 
 
+# Leading phrases dropped before parsing, all exactly six characters long
+REMINDER_PREFIXES = ('me to ', 'me in ', 'me at ')
+
+
 class UserFriendlyTime(commands.Converter):
     """That way quotes aren't absolutely necessary."""
 
@@ -278,11 +311,10 @@ class UserFriendlyTime(commands.Converter):
         if reminder is not None:
             tzinfo = await reminder.get_tzinfo(ctx.author.id)  # type: ignore[]
 
-        match = regex.match(argument)
+        match = regex.match(argument) if argument[:1].isdigit() else None
         if match is not None and match.group(0):
-            data = {k: int(v) for k, v in match.groupdict(default=0).items()}
             remaining = argument[match.end() :].strip()
-            dt = now + relativedelta(**data)  # type: ignore[]
+            dt = now + ShortTime.delta_from_match(match)
             result = FriendlyTimeResult(dt.astimezone(tzinfo))
             await result.ensure_constraints(ctx, self, now, remaining)
             return result
@@ -304,10 +336,8 @@ class UserFriendlyTime(commands.Converter):
         if argument.endswith('from now'):
             argument = argument[:-8].strip()
 
-        if argument[0:2] == 'me':  # noqa: SIM102
-            # starts with "me to", "me in", or "me at "
-            if argument[0:6] in {'me to ', 'me in ', 'me at '}:
-                argument = argument[6:]
+        if argument.startswith(REMINDER_PREFIXES):
+            argument = argument[6:]
 
         # Have to adjust the timezone so pdt knows how to handle things like "tomorrow at 6pm" in an aware way
         now = now.astimezone(tzinfo)
@@ -374,6 +404,18 @@ class UserFriendlyTime(commands.Converter):
         return result
 
 
+ONE_DAY = datetime.timedelta(days=1)
+# Unit names and brief suffixes, in the order human_timedelta reads them
+TIMEDELTA_ATTRS = (
+    ('year', 'y'),
+    ('month', 'mo'),
+    ('day', 'd'),
+    ('hour', 'h'),
+    ('minute', 'm'),
+    ('second', 's'),
+)
+
+
 def human_timedelta(
     dt: datetime.datetime,
     *,
@@ -403,43 +445,51 @@ def human_timedelta(
     # hardcode a month as 30 or 31 days.
     # A query like "11 months" can be interpreted as "!1 months and 6 days"
     if dt > now:
-        delta = relativedelta(dt, now)
+        start, end = now, dt
         output_suffix = ''
     else:
-        delta = relativedelta(now, dt)
+        start, end = dt, now
         output_suffix = ' ago' if suffix else ''
 
-    attrs = [
-        ('year', 'y'),
-        ('month', 'mo'),
-        ('day', 'd'),
-        ('hour', 'h'),
-        ('minute', 'm'),
-        ('second', 's'),
-    ]
-
     output = []
-    for attr, brief_attr in attrs:
-        elem = getattr(delta, attr + 's')
+    elapsed = end - start
+    if elapsed < ONE_DAY:
+        # Under a day there are no calendar units to account for
+        hours, remainder = divmod(elapsed.seconds, 3600)
+        minutes, seconds = divmod(remainder, 60)
+        values = (0, 0, 0, hours, minutes, seconds)
+    else:
+        delta = relativedelta(end, start)
+        values = (
+            delta.years,
+            delta.months,
+            delta.days,
+            delta.hours,
+            delta.minutes,
+            delta.seconds,
+        )
+
+    for elem, (attr, brief_attr) in zip(values, TIMEDELTA_ATTRS, strict=True):
         if not elem:
             continue
 
+        count = elem
         if attr == 'day':
-            weeks = delta.weeks
+            # Whole weeks are shown on their own, leaving the remaining days
+            weeks, count = divmod(elem, 7)
             if weeks:
-                elem -= weeks * 7
                 if not brief:
                     output.append(format(plural(weeks), 'week'))
                 else:
                     output.append(f'{weeks}w')
 
-        if elem <= 0:
+        if count <= 0:
             continue
 
         if brief:
-            output.append(f'{elem}{brief_attr}')
+            output.append(f'{count}{brief_attr}')
         else:
-            output.append(format(plural(elem), attr))
+            output.append(format(plural(count), attr))
 
     if accuracy is not None:
         output = output[:accuracy]